@@ -1,163 +1,480 @@
-from flask import render_template, url_for, redirect, flash, jsonify, request
+from flask import render_template, url_for, redirect, flash, request, session, current_app, Response
+from jinja2 import FileSystemBytecodeCache
+from werkzeug.exceptions import BadRequest, MethodNotAllowed, NotFound
 from pathlib import Path
-import importlib.util
+import ast
+import copy
+import hashlib
+import types
 import json
 import importlib
 import inspect
+import os
+import sys
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+
+# Tools directory, resolved once at import.
+_TOOLS_DIR: Path = (Path(__file__).parent.parent / "tools").resolve()
+
+# Per-file cache: path -> (st_mtime_ns, tool dict or None). Unchanged files skip re-parsing.
+_TOOLS_CACHE: dict[str, tuple[int, dict]] = {}
+# Assembled tools list, keyed by the (name, mtime) signature of the whole directory.
+_TOOLS_LIST_CACHE: dict = {"key": None, "tools": []}
+# Tool entries by name for O(1) lookup in the tool routes; rebuilt with the list cache.
+_TOOLS_BY_NAME: dict[str, dict] = {}
+# Names of the known tools, checked before any loading so unknown URLs fail fast.
+_TOOL_NAMES: frozenset[str] = frozenset()
+# With watchdog installed, a watcher thread flags changes in tools/ and load_tools()
+# skips the directory scan while the flag is clear. Without it, every call re-stats.
+_WATCHER = None
+_CACHE_DIRTY = True
+# Rendered pages: (view, tool_name) -> (html, _TOOLS_VERSION at render time).
+# _TOOLS_VERSION is bumped whenever load_tools() picks up a change in tools/.
+_PAGE_CACHE: dict[tuple, tuple[str, int]] = {}
+_TOOLS_VERSION = 0
+# Serialized /tools.json body and its ETag, for the _TOOLS_VERSION they were built from.
+_TOOLS_INDEX = {"version": None, "body": b"", "etag": ""}
+# Error pages are static, so they are rendered once when the routes are configured.
+_ERROR_PAGES = {
+    400: ("Bad Request", BadRequest.description),
+    404: ("Page Not Found", NotFound.description),
+    405: ("Method Not Allowed", MethodNotAllowed.description),
+}
+
+
+if Observer is not None:
+    class _ToolsEventHandler(FileSystemEventHandler):
+        def _mark_dirty(self, event):
+            global _CACHE_DIRTY
+            _CACHE_DIRTY = True
+
+        on_created = on_deleted = on_modified = on_moved = _mark_dirty
+
+
+# Start watching the tools directory, if watchdog is available.
+def _start_watcher(tools_dir: Path) -> None:
+    global _WATCHER
+    if Observer is None or _WATCHER is not None:
+        return
+    try:
+        observer = Observer()
+        observer.schedule(_ToolsEventHandler(), str(tools_dir), recursive=False)
+        observer.daemon = True
+        observer.start()
+    except Exception as e:
+        print(f"Error starting tools watcher: {e}")
+        return
+    _WATCHER = observer
+
+
+# Build the template-ready form of a DATAFLOW_SCHEMA: a deep copy whose 'input'
+# is a flat {field_name: field_props} dict. Done once per module load; the result is
+# a read-only view shared by every request.
+def _transform_schema(schema: dict | None) -> types.MappingProxyType | None:
+    if not schema:
+        return schema
+    schema = copy.deepcopy(schema)
+    # --- Robust input extraction ---
+    input_fields = None
+    if 'input' in schema:
+        input_schema = schema['input']
+        # If input is a dict with 'properties', use that (JSON Schema style)
+        if isinstance(input_schema, dict) and 'properties' in input_schema:
+            input_fields = {}
+            required_fields = set(input_schema.get('required', []))
+            for field_name, field_props in input_schema['properties'].items():
+                input_fields[field_name] = {
+                    'type': field_props.get('type', 'string'),
+                    'required': field_name in required_fields,
+                    'enum': field_props.get('enum'),
+                    'default': field_props.get('default'),
+                    'description': field_props.get('description'),
+                    'minimum': field_props.get('minimum'),
+                    'maximum': field_props.get('maximum'),
+                }
+        # If input is a dict of fields directly (not JSON Schema style)
+        elif isinstance(input_schema, dict):
+            input_fields = {}
+            for field_name, field_props in input_schema.items():
+                if isinstance(field_props, dict):
+                    input_fields[field_name] = {
+                        'type': field_props.get('type', 'string'),
+                        'required': field_props.get('required', True),
+                        'enum': field_props.get('enum'),
+                        'default': field_props.get('default'),
+                        'description': field_props.get('description'),
+                        'minimum': field_props.get('minimum'),
+                        'maximum': field_props.get('maximum'),
+                    }
+                else:
+                    # If just a type string
+                    input_fields[field_name] = {
+                        'type': str(field_props),
+                        'required': True,
+                        'enum': None,
+                        'default': None,
+                        'description': None,
+                        'minimum': None,
+                        'maximum': None,
+                    }
+        # If input is a list or something else, skip
+    schema['input'] = types.MappingProxyType(input_fields) if input_fields is not None else None
+    return types.MappingProxyType(schema)
+
+
+# Parameter names of a function, without 'self'.
+def _params(fn) -> tuple:
+    sig = inspect.signature(fn)
+    return tuple(p for p in sig.parameters if p != 'self')
+
+
+# Parameter names of a function node as inspect.signature would list them, without 'self'.
+def _ast_params(node: ast.FunctionDef) -> tuple:
+    args = node.args
+    names = [a.arg for a in args.posonlyargs + args.args]
+    if args.vararg:
+        names.append(args.vararg.arg)
+    names.extend(a.arg for a in args.kwonlyargs)
+    if args.kwarg:
+        names.append(args.kwarg.arg)
+    return tuple(name for name in names if name != 'self')
+
+
+# Read a tool's public functions and class methods from its source without executing it.
+# This is all the index page needs; the module itself is imported lazily by _ensure_loaded().
+def _scan_tool_metadata(tool_name: str, tool_path: str) -> dict | None:
+    try:
+        with open(tool_path, "r", encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename=tool_path)
+    except (OSError, SyntaxError, ValueError) as e:
+        print(f"Error parsing {tool_name}: {e}")
+        return None
+    module_name = f"tools.{tool_name}"
+    func_types = (ast.FunctionDef, ast.AsyncFunctionDef)
+    func_dict = {}
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and not node.name.startswith('_'):
+            for item in node.body:
+                if isinstance(item, func_types) and not item.name.startswith('_'):
+                    func_dict[f"{node.name}.{item.name}"] = {
+                        "doc": ast.get_docstring(item, clean=False) or "No documentation available",
+                        "name": item.name,
+                        "class": node.name,
+                        "parameters": _ast_params(item),
+                        "module": module_name,
+                        "is_class_method": True
+                    }
+        elif isinstance(node, func_types) and not node.name.startswith('_'):
+            func_dict[node.name] = {
+                "doc": ast.get_docstring(node, clean=False) or "No documentation available",
+                "name": node.name,
+                "parameters": _ast_params(node),
+                "module": module_name,
+                "is_class_method": False
+            }
+    if not func_dict:
+        return None
+    return {
+        "name": tool_name,
+        "functions": func_dict,
+        "path": os.path.basename(tool_path)
+    }
+
+
+# Import a tool as tools.<name>. sys.modules caches it, so repeated calls are lookups.
+def _import_tool(tool_name: str):
+    return importlib.import_module(f"tools.{tool_name}")
+
+
+# Forget the imported module of a tool so the next use re-imports it from disk.
+def _evict_module(tool_name: str) -> None:
+    sys.modules.pop(f"tools.{tool_name}", None)
+
+
+# Import a single tool file and collect its public functions and class methods.
+def _load_tool(tool_name: str, tool_path: str) -> dict | None:
+    func_dict = {}
+    try:
+        module = _import_tool(tool_name)
+        # Scan only what the module and its classes define themselves,
+        # instead of inspect.getmembers() resolving every inherited attribute.
+        for name, member in list(vars(module).items()):
+            if name.startswith('_'):
+                continue
+            if inspect.isclass(member) and member.__module__ == module.__name__:
+                for method_name, method in vars(member).items():
+                    if isinstance(method, staticmethod):
+                        method = method.__func__
+                    if inspect.isfunction(method) and not method_name.startswith('_'):
+                        func_dict[f"{name}.{method_name}"] = {
+                            "doc": method.__doc__ or "No documentation available",
+                            "name": method_name,
+                            "class": name,
+                            "parameters": _params(method),
+                            "module": module.__name__,
+                            "is_class_method": True
+                        }
+            elif inspect.isfunction(member) and member.__module__ == module.__name__:
+                func_dict[name] = {
+                    "doc": member.__doc__ or "No documentation available",
+                    "name": name,
+                    "parameters": _params(member),
+                    "module": module.__name__,
+                    "is_class_method": False
+                }
+    except Exception as e:
+        print(f"Error importing {tool_name}: {e}")
+    if not func_dict:
+        return None
+    # Resolve the schema and entrypoint once so run_tool() needs no attribute lookups
+    raw_schema = getattr(module, 'DATAFLOW_SCHEMA', None)
+    try:
+        entrypoint = getattr(module, raw_schema['entrypoint'], None) if raw_schema else None
+    except Exception as e:
+        print(f"Error resolving entrypoint for {tool_name}: {e}")
+        entrypoint = None
+    try:
+        schema = _transform_schema(raw_schema)
+    except Exception as e:
+        print(f"Error loading schema for {tool_name}: {e}")
+        schema = None
+    return {
+        "name": tool_name,
+        "functions": func_dict,
+        "path": os.path.basename(tool_path),
+        "schema": schema,
+        "dataflow_schema": raw_schema,
+        "entrypoint": entrypoint
+    }
+
 
 # Load data about files in tools directory. Return dict with built-in python functions.
+# Only source metadata is collected here; results are cached per file by mtime, so
+# only new or modified tools are re-parsed.
 def load_tools() -> list:
-    tools_dir = Path(__file__).parent.parent / "tools"
+    global _CACHE_DIRTY, _TOOLS_VERSION, _TOOL_NAMES, _TOOLS_BY_NAME
+    if _WATCHER is not None and not _CACHE_DIRTY:
+        return _TOOLS_LIST_CACHE["tools"]
+    # Clear before scanning so changes made during the scan mark the cache dirty again
+    _CACHE_DIRTY = False
+    entries = []
+    # scandir's DirEntry caches the file type, so filtering costs no extra stat calls
+    with os.scandir(_TOOLS_DIR) as it:
+        for entry in it:
+            if entry.is_file() and entry.name.endswith(".py") and not entry.name.startswith("_"):
+                entries.append((entry.name, entry.path, entry.stat().st_mtime_ns))
+
+    key = tuple((name, mtime) for name, _, mtime in entries)
+    if key == _TOOLS_LIST_CACHE["key"]:
+        return _TOOLS_LIST_CACHE["tools"]
+
+    stale = []
+    for name, path, mtime in entries:
+        entry = _TOOLS_CACHE.get(path)
+        if entry is None or entry[0] != mtime:
+            stale.append((name[:-3], path, mtime))
+
+    # Parse new or modified files
+    scanned = [_scan_tool_metadata(tool_name, path) for tool_name, path, _ in stale]
+    if stale:
+        # Let the import system see files added since its directory listing was cached
+        importlib.invalidate_caches()
+    for (tool_name, path, mtime), metadata in zip(stale, scanned):
+        _TOOLS_CACHE[path] = (mtime, metadata)
+        # Drop any module imported from the previous version of the file
+        _evict_module(tool_name)
+
     tools = []
-    for tool in tools_dir.iterdir():
-        if tool.is_file() and tool.suffix == ".py":
-            tool_name = tool.stem
-            func_dict = {}
-            try:
-                spec = importlib.util.spec_from_file_location(f"tools.{tool_name}", str(tool))
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-                for name, member in inspect.getmembers(module):
-                    if name.startswith('_'):
-                        continue
-                    if inspect.isclass(member) and member.__module__ == module.__name__:
-                        for method_name, method in inspect.getmembers(member, predicate=inspect.isfunction):
-                            if not method_name.startswith('_'):
-                                sig = inspect.signature(method)
-                                parameters = list(sig.parameters.keys())
-                                if 'self' in parameters:
-                                    parameters.remove('self')
-                                func_dict[f"{name}.{method_name}"] = {
-                                    "doc": method.__doc__ or "No documentation available",
-                                    "name": method_name,
-                                    "class": name,
-                                    "parameters": parameters,
-                                    "module": module.__name__,
-                                    "is_class_method": True
-                                }
-                    elif inspect.isfunction(member) and member.__module__ == module.__name__:
-                        sig = inspect.signature(member)
-                        func_dict[name] = {
-                            "doc": member.__doc__ or "No documentation available",
-                            "name": name,
-                            "parameters": list(sig.parameters.keys()),
-                            "module": module.__name__,
-                            "is_class_method": False
-                        }
-            except Exception as e:
-                print(f"Error importing {tool_name}: {e}")
-            if func_dict:
-                tools.append({
-                    "name": tool_name,
-                    "functions": func_dict,
-                    "path": str(tool.relative_to(tools_dir))
-                })
+    seen = set()
+    for name, path, mtime in entries:
+        seen.add(path)
+        metadata = _TOOLS_CACHE[path][1]
+        if metadata:
+            tools.append(metadata)
+
+    # Forget tools whose files were removed
+    for path in list(_TOOLS_CACHE):
+        if path not in seen:
+            del _TOOLS_CACHE[path]
+            _evict_module(os.path.basename(path)[:-3])
+
+    _TOOLS_LIST_CACHE["key"] = key
+    _TOOLS_LIST_CACHE["tools"] = tools
+    # Rebound rather than updated in place, so concurrent requests never see it half-built
+    _TOOLS_BY_NAME = {tool["name"]: tool for tool in tools}
+    _TOOL_NAMES = frozenset(_TOOLS_BY_NAME)
+    _TOOLS_VERSION += 1
+    _PAGE_CACHE.clear()
     return tools
 
 
+# Import a tool listed by load_tools() on first use and attach its runtime data
+# (introspected functions and template schema) to the cached entry.
+def _ensure_loaded(tool_data: dict) -> dict:
+    if "schema" not in tool_data:
+        tool_path = str(_TOOLS_DIR / tool_data["path"])
+        loaded = _load_tool(tool_data["name"], tool_path)
+        if loaded:
+            tool_data.update(loaded)
+        else:
+            tool_data.update(schema=None, dataflow_schema=None, entrypoint=None)
+    return tool_data
+
+
+# Parse JSON from str or bytes. orjson.JSONDecodeError subclasses json.JSONDecodeError,
+# so callers catch the same exception with either backend.
+def _json_loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# JSON response serialized with orjson when it is installed, stdlib json otherwise.
+def json_response(payload, status: int = 200) -> Response:
+    if orjson is not None:
+        body = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        body = json.dumps(payload)
+    return current_app.response_class(body, status=status, mimetype="application/json")
+
+
+# JSON-safe listing of the tools: names, paths and their functions' signatures and docs.
+def _tools_index_payload() -> list:
+    return [
+        {
+            "name": tool["name"],
+            "path": tool["path"],
+            "functions": {
+                key: {"name": func["name"], "doc": func["doc"], "parameters": list(func["parameters"])}
+                for key, func in tool["functions"].items()
+            },
+        }
+        for tool in load_tools()
+    ]
+
+
+# The tools listing serialized once per tools version, with an ETag of its content.
+# Hashing the body rather than using _TOOLS_VERSION keeps the tag stable across workers.
+def _tools_index_body() -> tuple[bytes, str]:
+    load_tools()
+    if _TOOLS_INDEX["version"] != _TOOLS_VERSION:
+        payload = _tools_index_payload()
+        body = orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode("utf-8")
+        _TOOLS_INDEX.update(version=_TOOLS_VERSION, body=body, etag=hashlib.sha1(body).hexdigest())
+    return _TOOLS_INDEX["body"], _TOOLS_INDEX["etag"]
+
+
+# Whether a tool name can be rejected without rescanning the tools directory for it.
+# Only the watcher can vouch that no tool was added since the last scan; without it
+# a miss falls through to load_tools(), whose scandir picks up new files.
+def _is_unknown_tool(tool_name: str) -> bool:
+    return _WATCHER is not None and not _CACHE_DIRTY and tool_name not in _TOOL_NAMES
+
+
+# Render a template once per tools version and serve the stored HTML afterwards.
+# Pages carrying flashed messages, and everything in debug mode, are rendered fresh.
+def _render_cached(key: tuple, template: str, **context):
+    if current_app.debug or "_flashes" in session:
+        return render_template(template, **context)
+    cached = _PAGE_CACHE.get(key)
+    if cached is not None and cached[1] == _TOOLS_VERSION:
+        return Response(cached[0], mimetype="text/html")
+    html = render_template(template, **context)
+    _PAGE_CACHE[key] = (html, _TOOLS_VERSION)
+    return html
+
+
+# Render every error page once, outside of any real request.
+def _render_error_pages(app) -> dict[int, str]:
+    pages = {}
+    with app.test_request_context("/error"):
+        for code, (title, message) in _ERROR_PAGES.items():
+            pages[code] = render_template("error.html", title=title, error_code=code, error_message=message)
+    return pages
+
+
+# Outside debug mode templates never change at runtime: skip the reload checks and keep
+# compiled templates in a bytecode cache shared across processes and restarts.
+# Jinja's default cache directory is per-user, mode 0700 and owner-checked, so no other
+# local user can plant bytecode that the app would load.
+def _configure_templates(app) -> None:
+    if app.debug:
+        return
+    app.config["TEMPLATES_AUTO_RELOAD"] = False
+    app.jinja_env.auto_reload = False
+    try:
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+    except (OSError, RuntimeError) as e:
+        print(f"Error creating template bytecode cache: {e}")
+
+
 def configure_routes(app):
+    _configure_templates(app)
+    # Warm the tool caches at startup so the first request doesn't pay for the import
+    load_tools()
+    _start_watcher(_TOOLS_DIR)
 
     @app.route("/")
     def index():
         tools = load_tools()
-        return render_template("index.html", title="Uzlow Web Tools", tools=tools)
+        return _render_cached(("index", None), "index.html", title="Uzlow Web Tools", tools=tools)
+    
+    @app.route("/tools.json")
+    def tools_index():
+        # Serialized once per tools version; clients and CDNs cache it and revalidate by ETag
+        body, etag = _tools_index_body()
+        response = current_app.response_class(body, mimetype="application/json")
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = "public, max-age=60, stale-while-revalidate=300"
+        return response.make_conditional(request)
     
     @app.route("/about")
     def about():
-        return render_template("about.html", title="About")
+        return _render_cached(("about", None), "about.html", title="About")
     
     @app.route("/t/<tool_name>")
     def tool(tool_name):
-        tools = load_tools()
-        tool_data = next((tool for tool in tools if tool["name"] == tool_name), None)
+        if _is_unknown_tool(tool_name):
+            flash("Tool not found", "error")
+            return redirect(url_for("index"))
+        load_tools()
+        tool_data = _TOOLS_BY_NAME.get(tool_name)
         if tool_data is None:
             flash("Tool not found", "error")
             return redirect(url_for("index"))
-        tools_dir = Path(__file__).parent.parent / "tools"
-        tool_path = tools_dir / f"{tool_name}.py"
-        try:
-            spec = importlib.util.spec_from_file_location(f"tools.{tool_name}", str(tool_path))
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-            schema = getattr(module, 'DATAFLOW_SCHEMA', None)
-            # --- Robust input extraction ---
-            input_fields = None
-            if schema and 'input' in schema:
-                input_schema = schema['input']
-                # If input is a dict with 'properties', use that (JSON Schema style)
-                if isinstance(input_schema, dict) and 'properties' in input_schema:
-                    input_fields = {}
-                    required_fields = set(input_schema.get('required', []))
-                    for field_name, field_props in input_schema['properties'].items():
-                        input_fields[field_name] = {
-                            'type': field_props.get('type', 'string'),
-                            'required': field_name in required_fields,
-                            'enum': field_props.get('enum'),
-                            'default': field_props.get('default'),
-                            'description': field_props.get('description'),
-                            'minimum': field_props.get('minimum'),
-                            'maximum': field_props.get('maximum'),
-                        }
-                # If input is a dict of fields directly (not JSON Schema style)
-                elif isinstance(input_schema, dict):
-                    input_fields = {}
-                    for field_name, field_props in input_schema.items():
-                        if isinstance(field_props, dict):
-                            input_fields[field_name] = {
-                                'type': field_props.get('type', 'string'),
-                                'required': field_props.get('required', True),
-                                'enum': field_props.get('enum'),
-                                'default': field_props.get('default'),
-                                'description': field_props.get('description'),
-                                'minimum': field_props.get('minimum'),
-                                'maximum': field_props.get('maximum'),
-                            }
-                        else:
-                            # If just a type string
-                            input_fields[field_name] = {
-                                'type': str(field_props),
-                                'required': True,
-                                'enum': None,
-                                'default': None,
-                                'description': None,
-                                'minimum': None,
-                                'maximum': None,
-                            }
-                # If input is a list or something else, skip
-            if schema:
-                schema['input'] = input_fields
-            tool_data['schema'] = schema
-        except Exception as e:
-            print(f"Error loading schema for {tool_name}: {e}")
-            tool_data['schema'] = None
-        return render_template("tool.html", title=f"Tool: {tool_name}", tool=tool_data)
+        _ensure_loaded(tool_data)
+        return _render_cached(("tool", tool_name), "tool.html", title=f"Tool: {tool_name}", tool=tool_data)
 
     @app.route("/t/<tool_name>/run", methods=['POST'])
     def run_tool(tool_name):
-        tools = load_tools()
-        tool_data = next((tool for tool in tools if tool["name"] == tool_name), None)
+        if _is_unknown_tool(tool_name):
+            return json_response({"error": "Tool not found"}, 404)
+        load_tools()
+        tool_data = _TOOLS_BY_NAME.get(tool_name)
         
         if tool_data is None:
-            return jsonify({"error": "Tool not found"}), 404
+            return json_response({"error": "Tool not found"}, 404)
             
         try:
-            # Import the module
-            tools_dir = Path(__file__).parent.parent / "tools"
-            tool_path = tools_dir / f"{tool_name}.py"
-            
-            spec = importlib.util.spec_from_file_location(f"tools.{tool_name}", str(tool_path))
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-            
-            # Get the schema if it exists
-            schema = getattr(module, 'DATAFLOW_SCHEMA', None)
+            # Schema and entrypoint are bound once when the tool is imported
+            _ensure_loaded(tool_data)
+            schema = tool_data["dataflow_schema"]
             if not schema:
-                return jsonify({"error": "Tool has no schema defined"}), 400
+                return json_response({"error": "Tool has no schema defined"}, 400)
                     
-            # Get the entrypoint function
-            entrypoint = getattr(module, schema['entrypoint'], None)
+            entrypoint = tool_data["entrypoint"]
             if not entrypoint:
-                return jsonify({"error": "Tool entrypoint not found"}), 400
+                return json_response({"error": "Tool entrypoint not found"}, 400)
 
             # Handle input processing
             if schema.get('input') is None:
@@ -165,9 +482,12 @@ def configure_routes(app):
                 result = entrypoint()
             else:
                 # Get input data from request
-                input_data = request.get_json(silent=True)
+                try:
+                    input_data = _json_loads(request.get_data()) if request.is_json else None
+                except json.JSONDecodeError:
+                    input_data = None
                 if input_data is None:
-                    return jsonify({"error": "Input required but not provided"}), 400
+                    return json_response({"error": "Input required but not provided"}, 400)
 
                 # Process fields marked as type:json
                 if isinstance(schema['input'], dict) and 'properties' in schema['input']:
@@ -176,27 +496,30 @@ def configure_routes(app):
                             try:
                                 # If the input is a string, try to parse it as JSON
                                 if isinstance(input_data[field_name], str):
-                                    input_data[field_name] = json.loads(input_data[field_name])
+                                    input_data[field_name] = _json_loads(input_data[field_name])
                             except json.JSONDecodeError:
-                                return jsonify({
+                                return json_response({
                                     "error": f"Invalid JSON format for field '{field_name}'"
-                                }), 400
+                                }, 400)
 
                 result = entrypoint(input_data)
             
-            return jsonify({"success": True, "result": result})
+            return json_response({"success": True, "result": result})
             
         except Exception as e:
-            return jsonify({"error": str(e)}), 500
+            return json_response({"error": str(e)}, 500)
+
+    # Rendered after the routes are registered, since the templates build their URLs
+    error_pages = _render_error_pages(app)
 
     @app.errorhandler(404)
     def page_not_found(e):
-        return render_template("error.html", title="Page Not Found" + str(e), error=404)
+        return error_pages[404], 404
 
     @app.errorhandler(405)
     def method_not_allowed(e):
-        return render_template("error.html", title="Method Not Allowed" + str(e), error=405)
+        return error_pages[405], 405
     
     @app.errorhandler(400)
     def bad_request(e):
-        return render_template("error.html", title="Bad Request" + str(e), error=400)
+        return error_pages[400], 400
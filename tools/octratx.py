@@ -1,9 +1,21 @@
 import re
 import json
-from typing import Dict, Any, List, Tuple, Optional
+import atexit
+import math
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Tuple, Optional, Union
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 DATAFLOW_SCHEMA = {
     "name": "octratx",
     "description": "Tool for managing Octra wallet transactions",
@@ -54,79 +66,196 @@ DATAFLOW_SCHEMA = {
     }
 }
 
+# Compiled once at import and shared by every wallet and worker thread. Used with
+# fullmatch(): "$" would also accept a trailing newline
+_ADDRESS_PATTERN = re.compile(r"oct[1-9A-HJ-NP-Za-km-z]{44}")
+
+_SHARED_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+def _get_session() -> requests.Session:
+    """Return the process-wide RPC session, creating it on first use.
+
+    Every process_transaction() call builds a new OctraWallet; sharing one
+    session keeps its pooled keep-alive connections warm across them."""
+    global _SHARED_SESSION
+    if _SHARED_SESSION is None:
+        with _SESSION_LOCK:
+            if _SHARED_SESSION is None:
+                session = requests.Session()
+                # Keep up to 32 connections to the RPC host alive instead of the
+                # default 10, and retry transient gateway errors with a short backoff.
+                # Only reads are retried: a transaction POST may already have been
+                # accepted when the gateway fails, and a resend would only be rejected as a
+                # duplicate nonce, turning a success into a reported failure
+                adapter = HTTPAdapter(
+                    pool_connections=32,
+                    pool_maxsize=32,
+                    max_retries=Retry(
+                        total=3,
+                        backoff_factor=0.2,
+                        status_forcelist=(502, 503, 504),
+                        allowed_methods=frozenset(['GET'])
+                    )
+                )
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                session.headers.update({'Connection': 'keep-alive', 'Content-Type': 'application/json'})
+                _SHARED_SESSION = session
+    return _SHARED_SESSION
+
+atexit.register(lambda: _SHARED_SESSION and _SHARED_SESSION.close())
+
+def _loads(data):
+    """Parse JSON from str or UTF-8 bytes with orjson when it is installed, stdlib
+    json otherwise. orjson.JSONDecodeError subclasses json.JSONDecodeError."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 class OctraWalletError(Exception):
     """Base exception for Octra wallet operations"""
     pass
 
 class OctraWallet:
-    def __init__(self, wallet_path: str = 'wallet.json', rpc_url: str = 'https://octra.network'):
+    # Constants
+    MICROUNIT = 1_000_000
+    STATUS_TTL = 2.0  # seconds a fetched nonce/balance is served from memory
+    HISTORY_TTL = 10.0  # seconds a fetched history is served from memory
+    # A stalled RPC endpoint fails fast instead of holding a pool slot forever
+    CONNECT_TIMEOUT = 3.0
+    READ_TIMEOUT = 10.0
+
+    def __init__(self, wallet: Union[str, Dict[str, Any], None] = None, rpc_url: str = 'https://octra.network'):
         """
         Initialize the Octra wallet.
         
         Args:
-            wallet_path: Path to wallet.json file
-            rpc_url: RPC endpoint URL
+            wallet: Wallet data dict (private_key, address and optional rpc_url),
+                or path to a wallet.json file
+            rpc_url: RPC endpoint URL, unless the wallet data provides one
         """
-        self.wallet_path = wallet_path
+        self.wallet_path = None
         self.rpc_url = rpc_url
         self.private_key = None
         self.address = None
         self.signing_key = None
         self.public_key = None
-        self.session = requests.Session()
+        self._addr_json = None
+        self.session = _get_session()
         self.balance_cache = None
         self.nonce_cache = None
         self.last_update = 0
+        # Next nonce to use, tracked locally after one sync with the network
+        self._nonce_counter: Optional[int] = None
+        self._nonce_lock = threading.Lock()
         self.transaction_history = []
         self.last_history_update = 0
-        
-        # Constants
-        self.MICROUNIT = 1_000_000
-        self.ADDRESS_PATTERN = re.compile(r"^oct[1-9A-HJ-NP-Za-km-z]{44}$")
-        self.AMOUNT_PATTERN = re.compile(r"^\d+(\.\d+)?$")
+
+        # Inline wallet data needs no file access at all
+        if isinstance(wallet, dict):
+            self._apply_wallet_data(wallet, "Invalid wallet data")
+        else:
+            self.wallet_path = wallet
+
+    def _apply_wallet_data(self, wallet_data: Dict[str, Any], error: str) -> None:
+        """Take the key, address and RPC endpoint from parsed wallet data"""
+        self.private_key = wallet_data.get('private_key')
+        self.address = wallet_data.get('address')
+        if not self.private_key or not self.address:
+            raise OctraWalletError(error)
+        self.rpc_url = wallet_data.get('rpc_url') or self.rpc_url
+        # JSON-encoded once; reused by every transaction body
+        self._addr_json = json.dumps(self.address)
 
     def load_wallet(self) -> None:
-        """Load wallet from file"""
+        """Load wallet from file, unless wallet data was passed to the constructor"""
+        if self.private_key and self.address:
+            return
+        if self.wallet_path is None:
+            raise OctraWalletError("No wallet data or wallet file given")
         try:
             if not Path(self.wallet_path).exists():
                 raise OctraWalletError(f"Wallet file not found: {self.wallet_path}")
             
-            with open(self.wallet_path, 'r') as f:
-                wallet_data = json.load(f)
-                self.private_key = wallet_data.get('private_key')
-                self.address = wallet_data.get('address')
-                
-            if not self.private_key or not self.address:
-                raise OctraWalletError("Invalid wallet file format")
+            with open(self.wallet_path, 'rb') as f:
+                wallet_data = _loads(f.read())
+            self._apply_wallet_data(wallet_data, "Invalid wallet file format")
                 
         except json.JSONDecodeError:
             raise OctraWalletError("Invalid wallet file format")
         except Exception as e:
             raise OctraWalletError(f"Failed to load wallet: {str(e)}")
 
+    def _request(self, method: str, path: str, **kwargs) -> requests.Response:
+        """
+        Send a request to the RPC endpoint through the pooled session
+        
+        Args:
+            method: HTTP method
+            path: Path relative to rpc_url
+            
+        Returns:
+            Response, already checked for an error status
+        """
+        kwargs.setdefault('timeout', (self.CONNECT_TIMEOUT, self.READ_TIMEOUT))
+        response = self.session.request(method, self.rpc_url + path, **kwargs)
+        response.raise_for_status()
+        return response
+
     def get_status(self, force_refresh: bool = False) -> Tuple[Optional[int], Optional[float]]:
         """
         Get current wallet status (nonce and balance)
         
         Args:
-            force_refresh: Force refresh of cached values
+            force_refresh: Ignore a status fetched less than STATUS_TTL seconds ago
             
         Returns:
             Tuple of (nonce, balance)
         """
+        now = time.monotonic()
+        if not force_refresh and self.last_update and now - self.last_update < self.STATUS_TTL:
+            return self.nonce_cache, self.balance_cache
         try:
-            response = self.session.get(f"{self.rpc_url}/v1/account/{self.address}")
-            response.raise_for_status()
-            data = response.json()
+            response = self._request('GET', f"/v1/account/{self.address}")
+            data = _loads(response.content)
             
             balance = float(data['balance']) / self.MICROUNIT
             nonce = int(data['nonce'])
             
+            self.nonce_cache, self.balance_cache = nonce, balance
+            self.last_update = now
             return nonce, balance
             
         except Exception as e:
             raise OctraWalletError(f"Failed to get wallet status: {str(e)}")
 
+    def _sync_nonce(self) -> None:
+        """Reset the local nonce counter from the network (caller holds _nonce_lock)"""
+        self._nonce_counter = self.get_status(force_refresh=True)[0]
+
+    def _reserve_nonces(self, count: int) -> range:
+        """
+        Reserve a contiguous range of nonces without a network round-trip
+        
+        Args:
+            count: Number of nonces to reserve
+            
+        Returns:
+            Range of reserved nonces
+        """
+        with self._nonce_lock:
+            if self._nonce_counter is None:
+                self._sync_nonce()
+            base = self._nonce_counter
+            self._nonce_counter = base + count
+        return range(base, base + count)
+
+    def _invalidate_nonce(self) -> None:
+        """Force a network sync before the next send"""
+        with self._nonce_lock:
+            self._nonce_counter = None
+
     def send_transaction(self, to_address: str, amount: float) -> Dict[str, Any]:
         """
         Send a single transaction
@@ -138,69 +267,110 @@ class OctraWallet:
         Returns:
             Transaction result
         """
-        if not self.ADDRESS_PATTERN.match(to_address):
+        if not _ADDRESS_PATTERN.fullmatch(to_address):
             raise OctraWalletError("Invalid recipient address")
             
-        if amount <= 0:
+        if not (isinstance(amount, (int, float)) and amount > 0 and math.isfinite(amount)):
             raise OctraWalletError("Amount must be positive")
             
+        result = self._submit_transaction(to_address, amount)
+        self.last_update = self.last_history_update = 0
+        return result
+
+    def _submit_transaction(self, to_address: str, amount: float, nonce: Optional[int] = None) -> Dict[str, Any]:
+        """Submit a transaction whose recipient and amount are already validated"""
         try:
             # This is a simplified version - in reality you'd need to:
             # 1. Create and sign the transaction
             # 2. Submit to network
             # 3. Wait for confirmation
-            payload = {
-                "from": self.address,
-                "to": to_address,
-                "amount": str(int(amount * self.MICROUNIT)),
-                "nonce": self.get_status()[0]
-            }
+            # The payload has a fixed shape, so it is formatted directly instead of
+            # going through json.dumps. to_address is safe to inline: it matched
+            # _ADDRESS_PATTERN in the caller, which only allows base58 characters.
+            amount_micro = int(amount * self.MICROUNIT)
+            if nonce is None:
+                nonce = self._reserve_nonces(1)[0]
+            body = (
+                f'{{"from":{self._addr_json},"to":"{to_address}",'
+                f'"amount":"{amount_micro}","nonce":{nonce}}}'
+            ).encode()
             
-            response = self.session.post(
-                f"{self.rpc_url}/v1/transactions", 
-                json=payload
-            )
-            response.raise_for_status()
+            response = self._request('POST', "/v1/transactions", data=body)
             
-            return response.json()
+            return _loads(response.content)
             
         except Exception as e:
+            # The network may not have accepted this nonce; resync before the next send
+            self._invalidate_nonce()
             raise OctraWalletError(f"Transaction failed: {str(e)}")
 
     def send_multiple_transactions(self, recipients: List[Tuple[str, float]], batch_size: int = 5) -> Dict[str, Any]:
         """
-        Send multiple transactions in batches
+        Send multiple transactions, keeping up to batch_size of them in flight
         
         Args:
             recipients: List of (address, amount) tuples
-            batch_size: Number of transactions per batch
+            batch_size: Maximum number of concurrent sends
             
         Returns:
-            Batch transaction results
+            Batch transaction results, in recipient order. A failed send is
+            reported as {"to": address, "error": message}.
         """
-        results = []
-        for i in range(0, len(recipients), batch_size):
-            batch = recipients[i:i + batch_size]
-            for addr, amt in batch:
-                result = self.send_transaction(addr, amt)
-                results.append(result)
+        # Validate every recipient before sending anything, with the lookups hoisted
+        _amatch = _ADDRESS_PATTERN.fullmatch
+        _isfin = math.isfinite
+        for addr, amt in recipients:
+            if not _amatch(addr):
+                raise OctraWalletError(f"Invalid recipient address: {addr}")
+            if not (isinstance(amt, (int, float)) and amt > 0 and _isfin(amt)):
+                raise OctraWalletError(f"Amount must be positive for {addr}")
+
+        if not recipients:
+            return {"batch_results": []}
+
+        # One nonce range for the whole batch instead of a status request per send
+        nonces = self._reserve_nonces(len(recipients))
+        # A bounded pool keeps batch_size sends in flight at all times, so one slow
+        # send no longer holds back the start of the next fixed-size chunk
+        with ThreadPoolExecutor(max_workers=max(1, batch_size)) as executor:
+            futures = [
+                executor.submit(self._submit_transaction, addr, amt, nonce)
+                for (addr, amt), nonce in zip(recipients, nonces)
+            ]
+        results = [None] * len(recipients)
+        for i, ((addr, _), future) in enumerate(zip(recipients, futures)):
+            try:
+                results[i] = future.result()
+            except OctraWalletError as e:
+                results[i] = {"to": addr, "error": str(e)}
+        # The cached status and history are stale after sending; refetch them once on next use
+        self.last_update = self.last_history_update = 0
         return {"batch_results": results}
 
-    def get_history(self) -> List[Dict[str, Any]]:
-        """Get transaction history"""
+    def get_history(self, force_refresh: bool = False) -> List[Dict[str, Any]]:
+        """
+        Get transaction history
+        
+        Args:
+            force_refresh: Ignore a history fetched less than HISTORY_TTL seconds ago
+            
+        Returns:
+            List of transactions
+        """
+        now = time.monotonic()
+        if not force_refresh and self.last_history_update and now - self.last_history_update < self.HISTORY_TTL:
+            return self.transaction_history
         try:
-            response = self.session.get(
-                f"{self.rpc_url}/v1/account/{self.address}/transactions"
-            )
-            response.raise_for_status()
-            return response.json()['transactions']
+            response = self._request('GET', f"/v1/account/{self.address}/transactions")
+            self.transaction_history = _loads(response.content)['transactions']
+            self.last_history_update = now
+            return self.transaction_history
         except Exception as e:
             raise OctraWalletError(f"Failed to get history: {str(e)}")
 
     def close(self) -> None:
-        """Close wallet session"""
-        if self.session:
-            self.session.close()
+        """Release the wallet. The RPC session is shared, so it stays open until exit"""
+        pass
 
 def process_transaction(input_data: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -214,12 +384,16 @@ def process_transaction(input_data: Dict[str, Any]) -> Dict[str, Any]:
 
     Example wallet_data:
         {
-            "priv": "private-key-here",
-            "addr": "octxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx",
-            "rpc": "https://octra.network"
+            "private_key": "private-key-here",
+            "address": "octxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx",
+            "rpc_url": "https://octra.network"
         }
     """
-    wallet = OctraWallet(input_data.get('wallet_data'))
+    # Wallet data must come with the request: never fall back to a file on the server
+    wallet_data = input_data.get('wallet_data')
+    if not isinstance(wallet_data, dict):
+        raise OctraWalletError("wallet_data required")
+    wallet = OctraWallet(wallet_data)
     
     try:
         wallet.load_wallet()
@@ -259,7 +433,7 @@ def process_transaction(input_data: Dict[str, Any]) -> Dict[str, Any]:
 
 def example_usage():
     """Example usage of the Octra wallet module"""
-    wallet = OctraWallet()
+    wallet = OctraWallet('wallet.json')
     
     try:
         wallet.load_wallet()
@@ -1,10 +1,13 @@
 import os
 import hashlib
-import hmac
 import secrets
 import base64
+import re
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple
-from nacl.signing import SigningKey
+from nacl.exceptions import BadSignatureError
+import nacl.bindings
 from nacl.public import PrivateKey
 import ecdsa
 from ecdsa.curves import SECP256k1, NIST256p
@@ -12,9 +15,33 @@ from ecdsa.keys import SigningKey as ECDSASigningKey
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import based58
+except ImportError:
+    based58 = None
+
+try:
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+except ImportError:
+    PBKDF2HMAC = None
+
+# hashlib's pbkdf2_hmac comes from _hashlib when Python is linked against OpenSSL;
+# otherwise it is a much slower pure-Python loop and cryptography is preferred
+_OPENSSL_PBKDF2 = hashlib.pbkdf2_hmac.__module__ == '_hashlib'
 
 WORDLIST_PATH = Path(__file__).parent.parent / "static" / "wordlist.txt"
 BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+# "oct" followed by 17-47 base58 characters (20-50 in total), matched in C;
+# fullmatch() because "$" would also accept a trailing newline
+_ADDRESS_RE = re.compile(rf"oct[{re.escape(BASE58_ALPHABET)}]{{17,47}}")
+# Every two-digit base58 string, indexed by its value, so the fallback encoder
+# needs one bignum divmod per pair of output digits instead of per digit
+_BASE58_PAIRS = tuple(a + b for a in BASE58_ALPHABET for b in BASE58_ALPHABET)
+# HMAC-SHA512 inner/outer pads as translate tables: key.translate() XORs every
+# byte at C speed, so a child derivation skips building an hmac object
+_HMAC_IPAD = bytes(x ^ 0x36 for x in range(256))
+_HMAC_OPAD = bytes(x ^ 0x5C for x in range(256))
 
 DATAFLOW_SCHEMA = {
     "entrypoint": "generate",
@@ -38,12 +65,14 @@ DATAFLOW_SCHEMA = {
     }
 }
 
-def load_wordlist(filename: str = WORDLIST_PATH) -> List[str]:
+# The wordlist never changes at runtime; read and validate it once per process
+@functools.lru_cache(maxsize=1)
+def load_wordlist(filename: str = WORDLIST_PATH) -> Tuple[str, ...]:
     if not os.path.exists(filename):
         raise FileNotFoundError(f"File {filename} not found!")
     
     with open(filename, 'r', encoding='utf-8') as f:
-        words = [line.strip() for line in f if line.strip()]
+        words = tuple(word for word in map(str.strip, f) if word)
     
     if len(words) != 2048:
         raise ValueError(f"Wordlist must contain 2048 words, found: {len(words)}")
@@ -55,45 +84,59 @@ def generate_entropy(strength: int = 128) -> bytes:
         raise ValueError("Strength must be 128, 160, 192, 224 or 256 bits")
     return secrets.token_bytes(strength // 8)
 
-def entropy_to_mnemonic(entropy: bytes, wordlist: List[str]) -> List[str]:
+def entropy_to_mnemonic(entropy: bytes, wordlist: Tuple[str, ...]) -> List[str]:
     checksum_bits = len(entropy) * 8 // 32
     checksum = hashlib.sha256(entropy).digest()
-    checksum_int = int.from_bytes(checksum[:1], 'big') >> (8 - checksum_bits)
+    checksum_int = checksum[0] >> (8 - checksum_bits)
     
     entropy_int = int.from_bytes(entropy, 'big')
     combined = (entropy_int << checksum_bits) | checksum_int
     
-    mnemonic = []
     bits = len(entropy) * 8 + checksum_bits
     
-    for i in range(bits // 11):
-        word_index = (combined >> (bits - (i + 1) * 11)) & 0x7FF
-        mnemonic.append(wordlist[word_index])
-    
-    return mnemonic
+    # Walk the 11-bit groups from the most significant end by their shift offset
+    return [wordlist[(combined >> shift) & 0x7FF] for shift in range(bits - 11, -1, -11)]
 
 def mnemonic_to_seed(mnemonic: List[str], passphrase: str = "") -> bytes:
     mnemonic_str = " ".join(mnemonic)
     salt = ("mnemonic" + passphrase).encode('utf-8')
+    if not _OPENSSL_PBKDF2 and PBKDF2HMAC is not None:
+        kdf = PBKDF2HMAC(algorithm=hashes.SHA512(), length=64, salt=salt, iterations=2048)
+        return kdf.derive(mnemonic_str.encode('utf-8'))
     seed = hashlib.pbkdf2_hmac('sha512', mnemonic_str.encode('utf-8'), salt, 2048)
     return seed
 
+# The master-key HMAC always uses the key b"Octra seed", so both padded key
+# blocks are absorbed once here and each derivation copies the hash states
+_MASTER_KEY_BLOCK = b"Octra seed".ljust(128, b'\x00')
+_MASTER_INNER = hashlib.sha512(_MASTER_KEY_BLOCK.translate(_HMAC_IPAD))
+_MASTER_OUTER = hashlib.sha512(_MASTER_KEY_BLOCK.translate(_HMAC_OPAD))
+
 def derive_master_key(seed: bytes) -> Tuple[bytes, bytes]:
-    key = b"Octra seed"
-    mac = hmac.new(key, seed, hashlib.sha512).digest()
+    inner = _MASTER_INNER.copy()
+    inner.update(seed)
+    outer = _MASTER_OUTER.copy()
+    outer.update(inner.digest())
+    mac = outer.digest()
     master_private_key = mac[:32]
     master_chain_code = mac[32:]
     return master_private_key, master_chain_code
 
+def _hmac_sha512(key: bytes, data: bytes) -> bytes:
+    # RFC 2104 with SHA-512's 128-byte block; keys here are 32-byte chain codes
+    block = key.ljust(128, b'\x00')
+    inner = hashlib.sha512(block.translate(_HMAC_IPAD))
+    inner.update(data)
+    return hashlib.sha512(block.translate(_HMAC_OPAD) + inner.digest()).digest()
+
 def derive_child_key_ed25519(private_key: bytes, chain_code: bytes, index: int) -> Tuple[bytes, bytes]:
     if index >= 0x80000000:
         data = b'\x00' + private_key + index.to_bytes(4, 'big')
     else:
-        signing_key = SigningKey(private_key)
-        public_key = signing_key.verify_key.encode()
+        public_key, _ = nacl.bindings.crypto_sign_seed_keypair(private_key)
         data = public_key + index.to_bytes(4, 'big')
     
-    mac = hmac.new(chain_code, data, hashlib.sha512).digest()
+    mac = _hmac_sha512(chain_code, data)
     child_private_key = mac[:32]
     child_chain_code = mac[32:]
     
@@ -137,15 +180,14 @@ def derive_for_network(seed: bytes, network_type: int = 0, network: int = 0,
     
     derived_key, derived_chain = derive_path(seed, full_path)
     
-    signing_key = SigningKey(derived_key)
-    verify_key = signing_key.verify_key
+    public_key, _ = nacl.bindings.crypto_sign_seed_keypair(derived_key)
     
-    derived_address = create_octra_address(verify_key.encode())
+    derived_address = create_octra_address(public_key)
     
     return {
         'private_key': derived_key,
         'chain_code': derived_chain,
-        'public_key': verify_key.encode(),
+        'public_key': public_key,
         'address': derived_address,
         'path': full_path,
         'network_type_name': get_network_type_name(network_type),
@@ -159,20 +201,21 @@ def base58_encode(data: bytes) -> str:
     if not data:
         return ""
     
+    if based58 is not None:
+        return based58.b58encode(data).decode()
+    
     num = int.from_bytes(data, 'big')
-    encoded = ""
+    pairs = []
     
     while num > 0:
-        num, remainder = divmod(num, 58)
-        encoded = BASE58_ALPHABET[remainder] + encoded
+        num, remainder = divmod(num, 58 * 58)
+        pairs.append(_BASE58_PAIRS[remainder])
+    pairs.reverse()
+    # The top pair may carry a zero digit ('1') that is not part of the number
+    encoded = ''.join(pairs).lstrip('1')
     
-    for byte in data:
-        if byte == 0:
-            encoded = '1' + encoded
-        else:
-            break
-    
-    return encoded
+    leading_zeros = len(data) - len(data.lstrip(b'\x00'))
+    return '1' * leading_zeros + encoded
 
 def create_octra_address(public_key: bytes) -> str:
     hash_digest = hashlib.sha256(public_key).digest()
@@ -181,41 +224,37 @@ def create_octra_address(public_key: bytes) -> str:
     return address
 
 def verify_address_format(address: str) -> bool:
-    if not address.startswith("oct"):
-        return False
-    if len(address) < 20 or len(address) > 50:
-        return False
-    base58_part = address[3:]
-    for char in base58_part:
-        if char not in BASE58_ALPHABET:
-            return False
-    return True
+    return _ADDRESS_RE.fullmatch(address) is not None
+
 
+TEST_MESSAGE = '{"from":"test","to":"test","amount":"1000000","nonce":1}'
+_TEST_MESSAGE_BYTES = TEST_MESSAGE.encode()
 
 def generate():
-    wordlist = load_wordlist()
+    return _generate_with(load_wordlist())
+
+def _generate_with(wordlist: Tuple[str, ...]) -> dict:
     entropy = generate_entropy(128)
     mnemonic = entropy_to_mnemonic(entropy, wordlist)
     seed = mnemonic_to_seed(mnemonic)
     master_private, master_chain = derive_master_key(seed)
     
-    signing_key = SigningKey(master_private)
-    verify_key = signing_key.verify_key
-    private_key_raw = signing_key.encode()
-    public_key_raw = verify_key.encode()
+    # Raw libsodium calls: the secret key is seed || public key, signatures are detached
+    public_key_raw, secret_key = nacl.bindings.crypto_sign_seed_keypair(master_private)
+    private_key_raw = master_private
     address = create_octra_address(public_key_raw)
     
     if not verify_address_format(address):
         raise ValueError("Invalid address format generated")
     
-    test_message = '{"from":"test","to":"test","amount":"1000000","nonce":1}'
-    signed = signing_key.sign(test_message.encode())
-    signature_b64 = base64.b64encode(signed.signature).decode()
+    message = _TEST_MESSAGE_BYTES
+    signature = nacl.bindings.crypto_sign(message, secret_key)[:nacl.bindings.crypto_sign_BYTES]
+    signature_b64 = base64.b64encode(signature).decode()
     
     try:
-        verify_key.verify(test_message.encode(), signed.signature)
+        nacl.bindings.crypto_sign_open(signature + message, public_key_raw)
         signature_valid = True
-    except:
+    except BadSignatureError:
         signature_valid = False
     
     return {
@@ -228,11 +267,20 @@ def generate():
         'public_key_b64': base64.b64encode(public_key_raw).decode(),
         'address': address,
         'entropy_hex': entropy.hex(),
-        'test_message': test_message,
+        'test_message': TEST_MESSAGE,
         'test_signature': signature_b64,
         'signature_valid': signature_valid
     }
 
+def generate_batch(n: int) -> List[dict]:
+    # The wordlist is resolved once for the whole batch. OpenSSL's PBKDF2 releases
+    # the GIL, so the seed stretching that dominates each wallet runs in parallel
+    if n <= 0:
+        return []
+    wordlist = load_wordlist()
+    with ThreadPoolExecutor(max_workers=min(n, os.cpu_count() or 1)) as executor:
+        return list(executor.map(lambda _: _generate_with(wordlist), range(n)))
+
 
 def save_wallet(data):
     
@@ -1,6 +1,12 @@
 """Password generator tool for generating secure passwords with customizable parameters."""
+import os
 import string
-import secrets
+
+# Character classes for reporting which ones a generated password contains
+_UPPERCASE = frozenset(string.ascii_uppercase)
+_LOWERCASE = frozenset(string.ascii_lowercase)
+_DIGITS = frozenset(string.digits)
+_SPECIAL = frozenset(string.punctuation)
 
 # Schema definition for the tool
 DATAFLOW_SCHEMA = {
@@ -38,6 +44,25 @@ DATAFLOW_SCHEMA = {
     }
 }
 
+def _random_chars(chars, length):
+    """Pick length characters uniformly from chars (at most 256) using bulk OS randomness.
+
+    Each random byte is masked down to the smallest power of two covering
+    len(chars) and rejected if it is out of range, so there is no modulo bias.
+    """
+    n = len(chars)
+    mask = (1 << (n - 1).bit_length()) - 1
+    picked = []
+    while len(picked) < length:
+        # Ask for twice what is still missing; rejections rarely exceed half
+        for b in os.urandom((length - len(picked)) * 2):
+            b &= mask
+            if b < n:
+                picked.append(chars[b])
+                if len(picked) == length:
+                    break
+    return ''.join(picked)
+
 def generate_password(params):
     """Generate a password based on the specified parameters.
     
@@ -75,14 +100,16 @@ def generate_password(params):
         
     # Generate password using secure random number generator
     try:
-        password = ''.join(secrets.choice(chars) for _ in range(length))
+        password = _random_chars(chars, length)
+        # One pass to collect the distinct characters, then a set test per class
+        present = set(password)
         return {
             "password": password,
             "length": len(password),
-            "contains_uppercase": any(c.isupper() for c in password),
-            "contains_lowercase": any(c.islower() for c in password),
-            "contains_numbers": any(c.isdigit() for c in password),
-            "contains_special": any(c in string.punctuation for c in password)
+            "contains_uppercase": not present.isdisjoint(_UPPERCASE),
+            "contains_lowercase": not present.isdisjoint(_LOWERCASE),
+            "contains_numbers": not present.isdisjoint(_DIGITS),
+            "contains_special": not present.isdisjoint(_SPECIAL)
         }
     except Exception as e:
         return {"error": str(e)}